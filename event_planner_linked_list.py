@@ -1,18 +1,40 @@
+import bisect
 import datetime
+import functools
 import logging
-from typing import Optional, List
-from dataclasses import dataclass
+import re
+import sys
+from typing import Iterable, Optional, List
+from dataclasses import dataclass, field
 
-# Configure logging for debugging
+# Configure logging (switch level to logging.DEBUG for parse tracing)
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[logging.StreamHandler()]
 )
 logger = logging.getLogger(__name__)
 
+# Strict YYYY-MM-DD HH:MM layout; field ranges are checked by fromisoformat()
+_DT_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}")
+
+# Cached date/time parser; repeated (date, time) pairs skip re-parsing
+@functools.lru_cache(maxsize=4096)
+def _parse_dt(date: str, time: str) -> datetime.datetime:
+    """Parse and validate date/time."""
+    value = f"{date} {time}"
+    if _DT_RE.fullmatch(value):
+        try:
+            dt = datetime.datetime.fromisoformat(value)
+            logger.debug("Parsed datetime: %s %s -> %s", date, time, dt)
+            return dt
+        except ValueError:
+            pass  # Out-of-range field, e.g. 25:00
+    logger.error("Invalid date/time format: %s %s", date, time)
+    raise ValueError("Invalid date or time format. Use YYYY-MM-DD and HH:MM.")
+
 # Event class for event details
-@dataclass
+@dataclass(slots=True, eq=False)
 class Event:
     event_id: int
     name: str
@@ -22,9 +44,21 @@ class Event:
     description: str
     attendees: str  # Comma-separated names
     reminder_set: bool
+    _dt: Optional[datetime.datetime] = field(default=None, repr=False)  # Parsed date/time
+
+    # Identity is the event ID; avoids field-by-field compares
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Event):
+            return NotImplemented
+        return self.event_id == other.event_id
+
+    def __hash__(self) -> int:
+        return self.event_id
 
 # Node for Linked List (tasks or attendees)
 class LLNode:
+    __slots__ = ('data', 'completed', 'next')
+
     def __init__(self, data: str, completed: bool = False):
         self.data = data
         self.completed = completed  # For tasks only
@@ -32,123 +66,163 @@ class LLNode:
 
 # Event Planner class with linked list functionality
 class EventPlanner:
-    def __init__(self):
+    def __init__(self, verbose: bool = False):
+        self.verbose = verbose  # Echo operations to stdout
         self.events = {}  # {event_id: Event}
+        self.events_by_dt = []  # Sorted [(datetime, event_id)] for range queries
         self.event_id_counter = 1
         self.todo_lists = {}  # {event_id: LLNode} for tasks
+        self.todo_tails = {}  # {event_id: LLNode} last task, for O(1) append
         self.attendees_lists = {}  # {event_id: LLNode} for attendees
         logger.info("EventPlanner initialized")
 
     def _get_datetime(self, date: str, time: str) -> datetime.datetime:
         """Parse and validate date/time."""
-        try:
-            dt = datetime.datetime.strptime(f"{date} {time}", "%Y-%m-%d %H:%M")
-            logger.debug(f"Parsed datetime: {date} {time} -> {dt}")
-            return dt
-        except ValueError:
-            logger.error(f"Invalid date/time format: {date} {time}")
-            raise ValueError("Invalid date or time format. Use YYYY-MM-DD and HH:MM.")
+        return _parse_dt(date, time)
 
     def create_event(self, name: str, date: str, time: str, location: str, description: str, attendees: str, reminder_set: bool) -> Event:
         """Create a new event."""
-        logger.info(f"Creating event: {name}, {date} {time}")
-        self._get_datetime(date, time)  # Validate
-        event = Event(self.event_id_counter, name, date, time, location, description, attendees, reminder_set)
+        logger.info("Creating event: %s, %s %s", name, date, time)
+        dt = self._get_datetime(date, time)  # Validate
+        date, time = sys.intern(date), sys.intern(time)  # Share strings across recurring slots
+        event = Event(self.event_id_counter, name, date, time, location, description, attendees, reminder_set, dt)
         self.events[event.event_id] = event
+        bisect.insort(self.events_by_dt, (dt, event.event_id))
         self.todo_lists[event.event_id] = None
+        self.todo_tails[event.event_id] = None
         self.attendees_lists[event.event_id] = None
         self.event_id_counter += 1
-        logger.info(f"Event created: ID={event.event_id}")
-        print(f"Created event: {event.name} (ID: {event.event_id}) on {event.date} at {event.time}")
+        logger.info("Event created: ID=%s", event.event_id)
+        if self.verbose:
+            print(f"Created event: {event.name} (ID: {event.event_id}) on {event.date} at {event.time}")
         return event
 
+    def bulk_create(self, rows: Iterable[tuple]) -> List[Event]:
+        """Create many events from (name, date, time, location, description, attendees, reminder_set) rows."""
+        # Unpack and validate every row before inserting any, so a bad row changes nothing
+        parsed = []
+        for name, date, time, location, description, attendees, reminder_set in rows:
+            dt = self._get_datetime(date, time)
+            parsed.append((name, sys.intern(date), sys.intern(time), location, description, attendees, reminder_set, dt))
+        logger.info("Bulk creating %s events", len(parsed))
+        events = []
+        for fields in parsed:
+            event = Event(self.event_id_counter, *fields)
+            self.events[event.event_id] = event
+            self.todo_lists[event.event_id] = None
+            self.todo_tails[event.event_id] = None
+            self.attendees_lists[event.event_id] = None
+            self.event_id_counter += 1
+            events.append(event)
+        # One sort merges the new keys into the index instead of an insort per event
+        self.events_by_dt.extend((event._dt, event.event_id) for event in events)
+        self.events_by_dt.sort()
+        logger.info("Bulk created %s events", len(events))
+        if self.verbose:
+            print(f"Created {len(events)} events")
+        return events
+
     def update_event(self, event_id: int, **kwargs) -> Optional[Event]:
         """Update event details."""
-        logger.info(f"Updating event ID={event_id}: {kwargs}")
+        logger.info("Updating event ID=%s: %s", event_id, kwargs)
         if event_id not in self.events:
-            logger.warning(f"Event {event_id} not found for update")
-            print(f"Error: Event ID {event_id} not found")
+            logger.warning("Event %s not found for update", event_id)
+            if self.verbose:
+                print(f"Error: Event ID {event_id} not found")
             return None
         event = self.events[event_id]
-        if "date" in kwargs or "time" in kwargs:
-            new_date = kwargs.get("date", event.date)
-            new_time = kwargs.get("time", event.time)
-            self._get_datetime(new_date, new_time)
+        new_dt = None
+        new_date = kwargs.get("date", event.date)
+        new_time = kwargs.get("time", event.time)
+        if (new_date, new_time) != (event.date, event.time):
+            new_dt = self._get_datetime(new_date, new_time)
+            kwargs.update(date=sys.intern(new_date), time=sys.intern(new_time))
         for key, value in kwargs.items():
-            if hasattr(event, key):
+            if key != "_dt" and hasattr(event, key):  # _dt is kept in step with events_by_dt below
                 setattr(event, key, value)
-        logger.info(f"Event {event_id} updated")
-        print(f"Updated event: {event.name} (ID: {event_id})")
+        if new_dt is not None:
+            del self.events_by_dt[bisect.bisect_left(self.events_by_dt, (event._dt, event_id))]
+            bisect.insort(self.events_by_dt, (new_dt, event_id))
+            event._dt = new_dt
+        logger.info("Event %s updated", event_id)
+        if self.verbose:
+            print(f"Updated event: {event.name} (ID: {event_id})")
         return event
 
     def delete_event(self, event_id: int) -> bool:
         """Delete an event and its linked lists."""
-        logger.info(f"Deleting event ID={event_id}")
+        logger.info("Deleting event ID=%s", event_id)
         if event_id not in self.events:
-            logger.warning(f"Event {event_id} not found for deletion")
-            print(f"Error: Event ID {event_id} not found")
+            logger.warning("Event %s not found for deletion", event_id)
+            if self.verbose:
+                print(f"Error: Event ID {event_id} not found")
             return False
-        event_name = self.events[event_id].name
-        del self.events[event_id]
+        event = self.events.pop(event_id)
+        event_name = event.name
+        del self.events_by_dt[bisect.bisect_left(self.events_by_dt, (event._dt, event_id))]
         self.todo_lists.pop(event_id, None)
+        self.todo_tails.pop(event_id, None)
         self.attendees_lists.pop(event_id, None)
-        logger.info(f"Event {event_id} deleted")
-        print(f"Deleted event: {event_name} (ID: {event_id})")
+        logger.info("Event %s deleted", event_id)
+        if self.verbose:
+            print(f"Deleted event: {event_name} (ID: {event_id})")
         return True
 
     def view_events(self, upcoming: bool = True) -> List[Event]:
         """View upcoming or past events."""
         current_date = datetime.datetime.now()
-        events = []
-        for event in self.events.values():
-            event_dt = self._get_datetime(event.date, event.time)
-            if (upcoming and event_dt >= current_date) or (not upcoming and event_dt < current_date):
-                events.append(event)
-        logger.info(f"Viewing {'upcoming' if upcoming else 'past'} events: {len(events)} found")
-        print(f"\n{'Upcoming' if upcoming else 'Past'} Events:")
-        for event in events:
-            print(f"ID: {event.event_id}, Name: {event.name}, Date: {event.date}, Time: {event.time}, Location: {event.location}")
+        # Upcoming events are the sorted suffix from the first event at/after now
+        split = bisect.bisect_left(self.events_by_dt, (current_date,))
+        keys = self.events_by_dt[split:] if upcoming else self.events_by_dt[:split]
+        events = [self.events[event_id] for _, event_id in keys]
+        logger.info("Viewing %s events: %s found", 'upcoming' if upcoming else 'past', len(events))
+        if self.verbose:
+            lines = [f"\n{'Upcoming' if upcoming else 'Past'} Events:"]
+            lines += [f"ID: {event.event_id}, Name: {event.name}, Date: {event.date}, Time: {event.time}, Location: {event.location}" for event in events]
+            print("\n".join(lines))
         return events
 
     def add_task(self, event_id: int, task: str) -> bool:
         """Add a task to an event."""
-        logger.info(f"Adding task to event ID={event_id}: {task}")
+        logger.info("Adding task to event ID=%s: %s", event_id, task)
         if event_id not in self.events:
-            logger.warning(f"Event {event_id} not found for adding task")
-            print(f"Error: Event ID {event_id} not found")
+            logger.warning("Event %s not found for adding task", event_id)
+            if self.verbose:
+                print(f"Error: Event ID {event_id} not found")
             return False
         new_node = LLNode(task)
         if not self.todo_lists[event_id]:
             self.todo_lists[event_id] = new_node
         else:
-            current = self.todo_lists[event_id]
-            while current.next:
-                current = current.next
-            current.next = new_node
-        logger.info(f"Task added to event {event_id}: {task}")
-        print(f"Added task '{task}' to event ID {event_id}")
+            self.todo_tails[event_id].next = new_node
+        self.todo_tails[event_id] = new_node
+        logger.info("Task added to event %s: %s", event_id, task)
+        if self.verbose:
+            print(f"Added task '{task}' to event ID {event_id}")
         return True
 
     def view_tasks(self, event_id: int) -> List[str]:
         """View tasks for an event."""
-        logger.info(f"Viewing tasks for event ID={event_id}")
+        logger.info("Viewing tasks for event ID=%s", event_id)
         if event_id not in self.events:
-            logger.warning(f"Event {event_id} not found for viewing tasks")
-            print(f"Error: Event ID {event_id} not found")
+            logger.warning("Event %s not found for viewing tasks", event_id)
+            if self.verbose:
+                print(f"Error: Event ID {event_id} not found")
             return []
         tasks = []
         current = self.todo_lists[event_id]
         while current:
             tasks.append(f"{'[x]' if current.completed else '[ ]'} {current.data}")
             current = current.next
-        print(f"\nTasks for event ID {event_id}:")
-        for task in tasks:
-            print(task)
+        if self.verbose:
+            lines = [f"\nTasks for event ID {event_id}:"]
+            lines += tasks
+            print("\n".join(lines))
         return tasks
 
 def main():
     """Demonstrate EventPlanner functionality."""
-    planner = EventPlanner()
+    planner = EventPlanner(verbose=True)
     
     # Create sample events
     planner.create_event(
@@ -1,12 +1,35 @@
+import collections
 import datetime
+import functools
 import logging
+import re
+import sys
 
 # Configure basic logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Strict YYYY-MM-DD HH:MM layout; field ranges are checked by fromisoformat()
+_DT_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}")
+
+# Cached date/time parser; repeated (date, time) pairs skip re-parsing
+@functools.lru_cache(maxsize=4096)
+def _parse_dt(date, time):
+    """Parse date/time."""
+    value = f"{date} {time}"
+    if _DT_RE.fullmatch(value):
+        try:
+            dt = datetime.datetime.fromisoformat(value)
+            return dt
+        except ValueError:
+            pass  # Out-of-range field, e.g. 25:00
+    logger.error("Invalid date/time format: %s %s", date, time)
+    raise ValueError("Use YYYY-MM-DD HH:MM")
+
 # Event class
 class Event:
+    __slots__ = ('event_id', 'name', 'date', 'time')
+
     def __init__(self, event_id, name, date, time):
         self.event_id = event_id
         self.name = name
@@ -18,57 +41,56 @@ class Event:
 
 # Event Planner class with stack functionality
 class EventPlanner:
-    def __init__(self):
+    def __init__(self, verbose=False):
+        self.verbose = verbose  # Echo operations to stdout
         self.events = {}  # {event_id: Event}
-        self.edit_stack = []  # Stack for recently edited events, max 10
+        self.edit_stack = collections.deque(maxlen=10)  # Stack for recently edited events, oldest evicted
         self.event_id_counter = 1
         logger.info("EventPlanner initialized")
-        print("EventPlanner initialized")
+        if self.verbose:
+            print("EventPlanner initialized")
 
     def _get_datetime(self, date, time):
         """Parse date/time."""
-        try:
-            dt = datetime.datetime.strptime(f"{date} {time}", "%Y-%m-%d %H:%M")
-            return dt
-        except ValueError:
-            logger.error(f"Invalid date/time format: {date} {time}")
-            raise ValueError("Use YYYY-MM-DD HH:MM")
+        return _parse_dt(date, time)
 
     def create_event(self, name, date, time):
         """Create a new event and push to stack."""
-        logger.info(f"Creating event: {name}, {date} {time}")
+        logger.info("Creating event: %s, %s %s", name, date, time)
         self._get_datetime(date, time)
+        date, time = sys.intern(date), sys.intern(time)  # Share strings across recurring slots
         event = Event(self.event_id_counter, name, date, time)
         self.events[event.event_id] = event
         self.edit_stack.append(event)
-        if len(self.edit_stack) > 10:
-            self.edit_stack.pop(0)
         self.event_id_counter += 1
-        logger.info(f"Event created: ID={event.event_id}")
-        print(f"Created event: {event.name} (ID: {event.event_id}) on {event.date} at {event.time}")
+        logger.info("Event created: ID=%s", event.event_id)
+        if self.verbose:
+            print(f"Created event: {event.name} (ID: {event.event_id}) on {event.date} at {event.time}")
         return event
 
     def update_event(self, event_id, name=None, date=None, time=None):
         """Update event details and push old state to stack."""
-        logger.info(f"Updating event ID={event_id}")
+        logger.info("Updating event ID=%s", event_id)
         if event_id not in self.events:
-            logger.info(f"Event {event_id} not found")
-            print(f"Error: Event ID {event_id} not found")
+            logger.info("Event %s not found", event_id)
+            if self.verbose:
+                print(f"Error: Event ID {event_id} not found")
             return None
         old_event = self.events[event_id].__copy__()
-        if date or time:
-            self._get_datetime(date or old_event.date, time or old_event.time)
+        new_date = date or old_event.date
+        new_time = time or old_event.time
+        if (new_date, new_time) != (old_event.date, old_event.time):
+            self._get_datetime(new_date, new_time)
         if name:
             self.events[event_id].name = name
         if date:
-            self.events[event_id].date = date
+            self.events[event_id].date = sys.intern(date)
         if time:
-            self.events[event_id].time = time
+            self.events[event_id].time = sys.intern(time)
         self.edit_stack.append(old_event)
-        if len(self.edit_stack) > 10:
-            self.edit_stack.pop(0)
-        logger.info(f"Event {event_id} updated")
-        print(f"Updated event: {self.events[event_id].name} (ID: {event_id})")
+        logger.info("Event %s updated", event_id)
+        if self.verbose:
+            print(f"Updated event: {self.events[event_id].name} (ID: {event_id})")
         return self.events[event_id]
 
     def undo_last_edit(self):
@@ -76,37 +98,42 @@ class EventPlanner:
         logger.info("Undoing last edit")
         if not self.edit_stack:
             logger.info("No edits to undo")
-            print("Error: No edits to undo")
+            if self.verbose:
+                print("Error: No edits to undo")
             return None
         last_event = self.edit_stack.pop()
         if last_event.event_id in self.events:
             self.events[last_event.event_id] = last_event
-            logger.info(f"Restored event ID={last_event.event_id}")
-            print(f"Restored event: {last_event.name} (ID: {last_event.event_id})")
+            logger.info("Restored event ID=%s", last_event.event_id)
+            if self.verbose:
+                print(f"Restored event: {last_event.name} (ID: {last_event.event_id})")
             return last_event
-        logger.info(f"Event ID={last_event.event_id} not found")
-        print(f"Error: Event ID {last_event.event_id} not found")
+        logger.info("Event ID=%s not found", last_event.event_id)
+        if self.verbose:
+            print(f"Error: Event ID {last_event.event_id} not found")
         return None
 
     def view_edited_events(self):
         """View the stack of recently edited events."""
-        logger.info(f"Viewing {len(self.edit_stack)} edited events")
-        print(f"\nRecently Edited Events:")
-        for event in self.edit_stack:
-            print(f"ID: {event.event_id}, Name: {event.name}, Date: {event.date}, Time: {event.time}")
-        return self.edit_stack.copy()
+        logger.info("Viewing %s edited events", len(self.edit_stack))
+        if self.verbose:
+            lines = [f"\nRecently Edited Events:"]
+            lines += [f"ID: {event.event_id}, Name: {event.name}, Date: {event.date}, Time: {event.time}" for event in self.edit_stack]
+            print("\n".join(lines))
+        return list(self.edit_stack)
 
     def view_events(self):
         """View all events."""
-        logger.info(f"Viewing {len(self.events)} events")
-        print(f"\nAll Events:")
-        for event_id, event in self.events.items():
-            print(f"ID: {event_id}, Name: {event.name}, Date: {event.date}, Time: {event.time}")
+        logger.info("Viewing %s events", len(self.events))
+        if self.verbose:
+            lines = [f"\nAll Events:"]
+            lines += [f"ID: {event_id}, Name: {event.name}, Date: {event.date}, Time: {event.time}" for event_id, event in self.events.items()]
+            print("\n".join(lines))
         return list(self.events.values())
 
 def main():
     """Demonstrate EventPlanner functionality."""
-    planner = EventPlanner()
+    planner = EventPlanner(verbose=True)
     
     # Create sample events
     try:
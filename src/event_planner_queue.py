@@ -1,87 +1,115 @@
 import datetime
+import functools
+import heapq
 import logging
+import re
+import sys
 
 # Configure basic logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Strict YYYY-MM-DD HH:MM layout; field ranges are checked by fromisoformat()
+_DT_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}")
+
+# Cached date/time parser; repeated (date, time) pairs skip re-parsing
+@functools.lru_cache(maxsize=4096)
+def _parse_dt(date, time):
+    """Parse date/time."""
+    value = f"{date} {time}"
+    if _DT_RE.fullmatch(value):
+        try:
+            dt = datetime.datetime.fromisoformat(value)
+            return dt
+        except ValueError:
+            pass  # Out-of-range field, e.g. 25:00
+    logger.error("Invalid date/time format: %s %s", date, time)
+    raise ValueError("Use YYYY-MM-DD HH:MM")
+
 # Event class
 class Event:
-    def __init__(self, event_id, name, date, time, reminder_set):
+    __slots__ = ('event_id', 'name', 'date', 'time', 'reminder_set', '_dt')
+
+    def __init__(self, event_id, name, date, time, reminder_set, dt=None):
         self.event_id = event_id
         self.name = name
         self.date = date
         self.time = time
         self.reminder_set = reminder_set
+        self._dt = dt  # Parsed date/time
 
     def __copy__(self):
-        return Event(self.event_id, self.name, self.date, self.time, self.reminder_set)
+        return Event(self.event_id, self.name, self.date, self.time, self.reminder_set, self._dt)
 
 # Event Planner class with queue functionality
 class EventPlanner:
-    def __init__(self):
+    def __init__(self, verbose=False):
+        self.verbose = verbose  # Echo operations to stdout
         self.events = {}  # {event_id: Event}
-        self.reminder_queue = []  # Queue for events with reminders
+        self.reminder_queue = {}  # {event_id: Event} with reminders, in FIFO insertion order
+        self.reminder_heap = []  # Min-heap of (datetime, event_id) for due-time scans
         self.event_id_counter = 1
         logger.info("EventPlanner initialized")
-        print("EventPlanner initialized")
+        if self.verbose:
+            print("EventPlanner initialized")
 
     def _get_datetime(self, date, time):
         """Parse date/time."""
-        try:
-            dt = datetime.datetime.strptime(f"{date} {time}", "%Y-%m-%d %H:%M")
-            return dt
-        except ValueError:
-            logger.error(f"Invalid date/time format: {date} {time}")
-            raise ValueError("Use YYYY-MM-DD HH:MM")
+        return _parse_dt(date, time)
 
     def create_event(self, name, date, time, reminder_set):
         """Create a new event and enqueue if reminder is set."""
-        logger.info(f"Creating event: {name}, {date} {time}")
-        self._get_datetime(date, time)
-        event = Event(self.event_id_counter, name, date, time, reminder_set)
+        logger.info("Creating event: %s, %s %s", name, date, time)
+        dt = self._get_datetime(date, time)
+        date, time = sys.intern(date), sys.intern(time)  # Share strings across recurring slots
+        event = Event(self.event_id_counter, name, date, time, reminder_set, dt)
         self.events[event.event_id] = event
         if reminder_set:
-            self.reminder_queue.append(event)
+            self.reminder_queue[event.event_id] = event
+            heapq.heappush(self.reminder_heap, (dt, event.event_id))
         self.event_id_counter += 1
-        logger.info(f"Event created: ID={event.event_id}")
-        print(f"Created event: {event.name} (ID: {event.event_id}) on {event.date} at {event.time}")
+        logger.info("Event created: ID=%s", event.event_id)
+        if self.verbose:
+            print(f"Created event: {event.name} (ID: {event.event_id}) on {event.date} at {event.time}")
         return event
 
     def process_reminders(self):
         """Process reminders from the queue based on current time."""
-        current_time = datetime.datetime.now()
-        processed = []
-        for event in self.reminder_queue:
-            event_time = self._get_datetime(event.date, event.time)
-            if event_time <= current_time + datetime.timedelta(minutes=15):
-                logger.info(f"Reminder: {event.name} at {event_time}")
+        deadline = datetime.datetime.now() + datetime.timedelta(minutes=15)
+        processed = 0
+        # Only reminders that are due are popped; the rest of the heap is untouched
+        while self.reminder_heap and self.reminder_heap[0][0] <= deadline:
+            event_time, event_id = heapq.heappop(self.reminder_heap)
+            event = self.reminder_queue.pop(event_id)
+            logger.info("Reminder: %s at %s", event.name, event_time)
+            if self.verbose:
                 print(f"Reminder: {event.name} at {event.date} {event.time}")
-                processed.append(event)
-        for event in processed:
-            self.reminder_queue.remove(event)
-        logger.info(f"Processed {len(processed)} reminders, {len(self.reminder_queue)} remaining")
-        print(f"Processed {len(processed)} reminders, {len(self.reminder_queue)} remaining")
+            processed += 1
+        logger.info("Processed %s reminders, %s remaining", processed, len(self.reminder_queue))
+        if self.verbose:
+            print(f"Processed {processed} reminders, {len(self.reminder_queue)} remaining")
 
     def view_reminder_queue(self):
         """View the current reminder queue."""
-        logger.info(f"Viewing {len(self.reminder_queue)} reminders in queue")
-        print(f"\nReminder Queue:")
-        for event in self.reminder_queue:
-            print(f"ID: {event.event_id}, Name: {event.name}, Date: {event.date}, Time: {event.time}")
-        return self.reminder_queue.copy()
+        logger.info("Viewing %s reminders in queue", len(self.reminder_queue))
+        if self.verbose:
+            lines = [f"\nReminder Queue:"]
+            lines += [f"ID: {event.event_id}, Name: {event.name}, Date: {event.date}, Time: {event.time}" for event in self.reminder_queue.values()]
+            print("\n".join(lines))
+        return list(self.reminder_queue.values())
 
     def view_events(self):
         """View all events."""
-        logger.info(f"Viewing {len(self.events)} events")
-        print(f"\nAll Events:")
-        for event_id, event in self.events.items():
-            print(f"ID: {event_id}, Name: {event.name}, Date: {event.date}, Time: {event.time}")
+        logger.info("Viewing %s events", len(self.events))
+        if self.verbose:
+            lines = [f"\nAll Events:"]
+            lines += [f"ID: {event_id}, Name: {event.name}, Date: {event.date}, Time: {event.time}" for event_id, event in self.events.items()]
+            print("\n".join(lines))
         return list(self.events.values())
 
 def main():
     """Demonstrate EventPlanner functionality."""
-    planner = EventPlanner()
+    planner = EventPlanner(verbose=True)
     
     # Create sample events
     try: